@@ -2,7 +2,7 @@ import streamlit as st
 import pandas as pd
 
 from app.controller.app_controller import AppController
-from app.utils.validators import ensure_dataframe_loaded, numeric_columns, all_columns
+from app.utils.validators import ensure_dataframe_loaded, numeric_columns, all_columns, selected_point_indices
 
 st.set_page_config(page_title="CS6P05 Visual Analytics", layout="wide")
 
@@ -142,7 +142,7 @@ elif page == "Visualise":
     st.header("Visualise")
     ensure_dataframe_loaded(controller)
 
-    chart_type = st.selectbox("Chart type", ["Bar", "Line", "Scatter", "Histogram", "Correlation Heatmap"])
+    chart_type = st.selectbox("Chart type", ["Bar", "Line", "Scatter", "Histogram", "Correlation Heatmap", "Linked Dashboard"])
     df = controller.df
 
     fig = None
@@ -163,6 +163,34 @@ elif page == "Visualise":
         cols = st.multiselect("Columns (numeric)", numeric_columns(df), default=numeric_columns(df)[:6])
         fig = controller.make_correlation(cols)
 
+    elif chart_type == "Linked Dashboard":
+        st.caption("Box-select bars in any chart to filter the others. Indexes are built once per dataset version.")
+        nums = numeric_columns(df)
+        default_cols = (nums + [c for c in all_columns(df) if c not in nums])[:4]
+        link_cols = st.multiselect("Linked columns", all_columns(df), default=default_cols, max_selections=6)
+        bins = st.slider("Bins", min_value=5, max_value=100, value=30)
+        agg_fn = st.selectbox("Aggregation", ["count", "sum", "mean"])
+        measure = st.selectbox("Measure (numeric)", nums) if agg_fn != "count" and nums else None
+
+        # Selections live in each chart's widget state; bumping the generation gives fresh widgets
+        if "linked_generation" not in st.session_state:
+            st.session_state.linked_generation = 0
+        if st.button("Clear selections"):
+            st.session_state.linked_generation += 1
+        keys = {c: f"linked_{st.session_state.linked_generation}_{bins}_{c}" for c in link_cols}
+        selections = {c: selected_point_indices(st.session_state.get(k)) for c, k in keys.items()}
+
+        if link_cols:
+            try:
+                figs, selected_rows = controller.make_linked_charts(link_cols, selections, bins, measure, agg_fn)
+                st.metric("Rows in selection", f"{selected_rows:,} / {controller.row_count():,}")
+                grid = st.columns(2)
+                for i, c in enumerate(link_cols):
+                    with grid[i % 2]:
+                        st.plotly_chart(figs[c], use_container_width=True, key=keys[c], on_select="rerun", selection_mode=("box", "points"))
+            except Exception as e:
+                st.error(f"Linked dashboard failed: {e}")
+
     if fig is not None:
         st.plotly_chart(fig, use_container_width=True)
         controller.set_last_figure(fig)
@@ -205,11 +233,40 @@ elif page == "Saved Snapshots":
 
     st.divider()
     st.subheader("Available snapshots")
-    snaps = controller.list_snapshots()
+    col_q, col_type, col_size = st.columns([3, 1, 1])
+    with col_q:
+        query = st.text_input("Search snapshot or column names", value="")
+    with col_type:
+        source_type = st.selectbox("Source type", ["(all)"] + controller.snapshot_source_types())
+        source_type = None if source_type == "(all)" else source_type
+    with col_size:
+        page_size = st.selectbox("Per page", [25, 50, 100], index=1)
+
+    # Stack of keyset cursors, one per visited page; reset whenever the filters change
+    filters = (query, source_type, page_size)
+    if st.session_state.get("snapshot_filters") != filters:
+        st.session_state.snapshot_filters = filters
+        st.session_state.snapshot_cursors = [None]
+    cursors = st.session_state.snapshot_cursors
+
+    page_result = controller.snapshot_page(limit=page_size, cursor=cursors[-1], query=query, source_type=source_type)
+    snaps = page_result.items
     if not snaps:
-        st.info("No snapshots saved yet.")
+        st.info("No snapshots saved yet." if not query and source_type is None and len(cursors) == 1 else "No matching snapshots.")
     else:
         st.dataframe(pd.DataFrame(snaps), use_container_width=True)
+        nav_prev, nav_page, nav_next = st.columns([1, 2, 1])
+        with nav_prev:
+            if st.button("Previous", disabled=len(cursors) == 1):
+                cursors.pop()
+                st.rerun()
+        with nav_page:
+            st.caption(f"Page {len(cursors)}")
+        with nav_next:
+            if st.button("Next", disabled=page_result.next_cursor is None):
+                cursors.append(page_result.next_cursor)
+                st.rerun()
+
         snap_ids = [s["dataset_id"] for s in snaps]
         chosen = st.selectbox("Select snapshot ID to load", snap_ids)
         if st.button("Load selected snapshot"):
@@ -0,0 +1,90 @@
+"""Headless batch entry point: python -m app.cli data/*.csv --steps steps.json --snapshot --export-dir out/"""
+from __future__ import annotations
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from app.controller.batch_runner import BatchJob, BatchRunner, default_workers
+
+def _load_json_arg(value: str | None):
+    # Accept inline JSON or a path to a JSON file
+    if not value:
+        return None
+    path = Path(value)
+    if path.is_file():
+        return json.loads(path.read_text(encoding="utf-8"))
+    return json.loads(value)
+
+def _positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return n
+
+def _expand_inputs(inputs: list[str]) -> list[Path]:
+    paths = []
+    for item in inputs:
+        p = Path(item)
+        if p.is_dir():
+            paths.extend(sorted(p.glob("*.csv")))
+        else:
+            paths.append(p)
+    return paths
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="app.cli", description="Run ingest -> transform -> snapshot -> export over CSV files without Streamlit.")
+    parser.add_argument("inputs", nargs="+", help="CSV files or directories containing CSV files")
+    parser.add_argument("--steps", help="Transformation steps as inline JSON or a JSON file (list of {\"op\": ...} dicts)")
+    parser.add_argument("--snapshot", action="store_true", help="Save each result as a snapshot")
+    parser.add_argument("--export-dir", help="Write each result as CSV (and chart PNG) into this directory")
+    parser.add_argument("--chart", help="Chart spec as inline JSON or a JSON file; requires --export-dir")
+    parser.add_argument("--workers", type=_positive_int, default=default_workers(), help="Maximum files processed concurrently")
+    parser.add_argument("--db", default="app.db", help="SQLite metadata database")
+    parser.add_argument("--snapshot-dir", default="data/snapshots", help="Directory for snapshot Parquet files")
+    parser.add_argument("--json", action="store_true", help="Print the run summary as JSON")
+    return parser
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.chart and not args.export_dir:
+        parser.error("--chart requires --export-dir")
+
+    specs = {}
+    for flag, value in (("--steps", args.steps), ("--chart", args.chart)):
+        try:
+            specs[flag] = _load_json_arg(value)
+        except json.JSONDecodeError as e:
+            parser.error(f"{flag}: not an existing JSON file or valid inline JSON ({e})")
+
+    job = BatchJob(
+        steps=specs["--steps"] or [],
+        snapshot=args.snapshot,
+        export_dir=Path(args.export_dir) if args.export_dir else None,
+        chart=specs["--chart"]
+    )
+    runner = BatchRunner(db_path=args.db, snapshot_dir=args.snapshot_dir, max_workers=args.workers)
+    try:
+        summary = runner.run(_expand_inputs(args.inputs), job)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.json:
+        print(json.dumps({
+            "summary": summary.throughput(),
+            "results": [r.__dict__ for r in summary.results]
+        }, indent=2))
+    else:
+        for r in summary.results:
+            status = "ok" if r.ok else f"FAILED ({r.error})"
+            print(f"{r.path}: {r.rows_in} -> {r.rows_out} rows in {r.seconds:.2f}s {status}")
+        t = summary.throughput()
+        print(
+            f"{t['files_ok']}/{t['files']} files in {t['seconds']}s with {t['workers']} workers: "
+            f"{t['rows_per_sec']} rows/s, {t['files_per_sec']} files/s, {t['mb_per_sec']} MB/s"
+        )
+    return 1 if summary.files_failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+import os
+import time
+
+from app.controller.core import ControllerCore
+from app.services.persistence_manager import PersistenceManager
+
+# Keys each step op / chart type needs; checked before any file is read
+_STEP_KEYS = {
+    "missing": ("strategy",),
+    "filter": ("column", "operator", "value"),
+    "sort": ("columns",),
+    "groupby": ("group_cols", "agg_fn"),
+}
+_CHART_KEYS = {
+    "Bar": ("x", "y"),
+    "Line": ("x", "y"),
+    "Scatter": ("x", "y"),
+    "Histogram": ("column",),
+    "Correlation Heatmap": ("columns",),
+}
+
+@dataclass
+class BatchJob:
+    # Transformation steps, applied in order. Each step is a dict with an "op" key:
+    #   {"op": "missing", "strategy": "Fill missing (0)", "custom_val": None}
+    #   {"op": "filter", "column": "x", "operator": ">", "value": 3}
+    #   {"op": "sort", "columns": ["x"], "ascending": True}
+    #   {"op": "groupby", "group_cols": ["g"], "agg_col": "x", "agg_fn": "mean"}
+    steps: list[dict] = field(default_factory=list)
+    snapshot: bool = False
+    export_dir: Path | None = None
+    # Optional chart exported as PNG next to the CSV, e.g. {"type": "Histogram", "column": "x", "bins": 30}
+    chart: dict | None = None
+
+@dataclass
+class FileResult:
+    path: str
+    ok: bool
+    rows_in: int = 0
+    rows_out: int = 0
+    bytes_in: int = 0
+    seconds: float = 0.0
+    snapshot_id: int | None = None
+    outputs: list[str] = field(default_factory=list)
+    error: str = ""
+
+@dataclass
+class BatchSummary:
+    results: list[FileResult]
+    seconds: float
+    workers: int
+
+    @property
+    def files_ok(self) -> int:
+        return sum(1 for r in self.results if r.ok)
+
+    @property
+    def files_failed(self) -> int:
+        return len(self.results) - self.files_ok
+
+    @property
+    def rows_in(self) -> int:
+        return sum(r.rows_in for r in self.results)
+
+    @property
+    def bytes_in(self) -> int:
+        return sum(r.bytes_in for r in self.results)
+
+    def throughput(self) -> dict:
+        secs = self.seconds or 1e-9
+        return {
+            "files": len(self.results),
+            "files_ok": self.files_ok,
+            "files_failed": self.files_failed,
+            "workers": self.workers,
+            "seconds": round(self.seconds, 3),
+            "rows_in": self.rows_in,
+            "rows_per_sec": round(self.rows_in / secs, 1),
+            "files_per_sec": round(len(self.results) / secs, 2),
+            "mb_per_sec": round(self.bytes_in / secs / 1_000_000, 2),
+        }
+
+def default_workers() -> int:
+    return min(4, os.cpu_count() or 1)
+
+class BatchRunner:
+    """Run ingest -> transform -> snapshot -> export over many CSV files without Streamlit.
+
+    Each file gets its own ControllerCore; the PersistenceManager (and its SQLite engine) is shared.
+    """
+
+    def __init__(self, db_path: str = "app.db", snapshot_dir: str | Path = "data/snapshots", max_workers: int | None = None):
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self.persistence = PersistenceManager(db_path=db_path)
+        self.snapshot_dir = Path(snapshot_dir)
+        self.max_workers = max_workers or default_workers()
+
+    def run(self, paths: list[str | Path], job: BatchJob) -> BatchSummary:
+        paths = [Path(p) for p in paths]
+        self._validate(job)
+        if job.export_dir is not None:
+            # Exports are named by file stem; two inputs with the same stem would overwrite each other
+            seen: dict[str, Path] = {}
+            for p in paths:
+                if p.stem in seen:
+                    raise ValueError(f"Inputs {seen[p.stem]} and {p} would both export to '{p.stem}'.")
+                seen[p.stem] = p
+            Path(job.export_dir).mkdir(parents=True, exist_ok=True)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = list(pool.map(lambda p: self.run_file(p, job), paths))
+        return BatchSummary(results=results, seconds=time.perf_counter() - start, workers=self.max_workers)
+
+    def _validate(self, job: BatchJob):
+        if not isinstance(job.steps, list):
+            raise ValueError("Steps must be a list of {\"op\": ...} objects.")
+        for i, step in enumerate(job.steps, start=1):
+            if not isinstance(step, dict):
+                raise ValueError(f"Step {i} must be an object with an \"op\" key.")
+            op = step.get("op")
+            if op not in _STEP_KEYS:
+                raise ValueError(f"Step {i}: unknown op {op!r} (expected one of {', '.join(_STEP_KEYS)}).")
+            missing = [k for k in _STEP_KEYS[op] if k not in step]
+            if missing:
+                raise ValueError(f"Step {i} ({op}) is missing: {', '.join(missing)}.")
+        if job.chart:
+            if not isinstance(job.chart, dict):
+                raise ValueError("Chart must be an object with a \"type\" key.")
+            chart_type = job.chart.get("type")
+            if chart_type not in _CHART_KEYS:
+                raise ValueError(f"Unsupported chart type: {chart_type!r} (expected one of {', '.join(_CHART_KEYS)}).")
+            missing = [k for k in _CHART_KEYS[chart_type] if k not in job.chart]
+            if missing:
+                raise ValueError(f"Chart ({chart_type}) is missing: {', '.join(missing)}.")
+
+    def run_file(self, path: Path, job: BatchJob) -> FileResult:
+        result = FileResult(path=str(path), ok=False)
+        start = time.perf_counter()
+        try:
+            result.bytes_in = path.stat().st_size
+            core = ControllerCore(persistence=self.persistence, snapshot_dir=self.snapshot_dir)
+            core.load_csv(path, dataset_name=path.name)
+            result.rows_in = core.row_count()
+
+            for step in job.steps:
+                self._apply_step(core, step)
+            result.rows_out = core.row_count()
+
+            if job.snapshot:
+                result.snapshot_id = core.save_snapshot(path.stem)
+            if job.export_dir is not None:
+                csv_path = Path(job.export_dir) / f"{path.stem}.csv"
+                csv_path.write_bytes(core.export_csv_bytes())
+                result.outputs.append(str(csv_path))
+                if job.chart:
+                    core.set_last_figure(self._make_chart(core, job.chart))
+                    png_path = Path(job.export_dir) / f"{path.stem}.png"
+                    png_path.write_bytes(core.export_last_chart_png_bytes())
+                    result.outputs.append(str(png_path))
+            result.ok = True
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def _apply_step(self, core: ControllerCore, step: dict):
+        op = step.get("op")
+        if op == "missing":
+            return core.apply_missing_strategy(step["strategy"], step.get("custom_val"))
+        if op == "filter":
+            return core.apply_filter(step["column"], step["operator"], step["value"])
+        if op == "sort":
+            return core.apply_sort(step["columns"], step.get("ascending", True))
+        if op == "groupby":
+            return core.apply_groupby(step["group_cols"], step.get("agg_col"), step["agg_fn"])
+        raise ValueError(f"Unknown batch step: {op}")
+
+    def _make_chart(self, core: ControllerCore, chart: dict):
+        chart_type = chart.get("type")
+        if chart_type in ("Bar", "Line", "Scatter"):
+            return core.make_xy_chart(chart_type, chart["x"], chart["y"], chart.get("color"))
+        if chart_type == "Histogram":
+            return core.make_histogram(chart["column"], int(chart.get("bins", 30)))
+        if chart_type == "Correlation Heatmap":
+            return core.make_correlation(chart["columns"])
+        raise ValueError(f"Unsupported chart type: {chart_type}")
@@ -0,0 +1,212 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+import uuid
+import pandas as pd
+
+from app.model.dataset_manager import DatasetManager
+from app.services.transformation_engine import TransformationEngine
+from app.services.export_manager import ExportManager
+from app.services.persistence_manager import PersistenceManager
+from app.services.crossfilter_index import CrossFilterIndex
+
+@dataclass
+class ControllerState:
+    # Same attributes AppController keeps in st.session_state
+    df: pd.DataFrame | None = None
+    last_fig: object | None = None
+    dataset_name: str | None = None
+    crossfilter: CrossFilterIndex | None = None
+
+class ControllerCore:
+    """Session-agnostic controller: all app operations, with state held in a plain object.
+
+    AppController binds ``state`` to ``st.session_state``; batch jobs use a ControllerState.
+    Plotly is only imported once a chart is requested.
+    """
+
+    def __init__(self, state=None, persistence: PersistenceManager | None = None,
+                 db_path: str = "app.db", snapshot_dir: str | Path = "data/snapshots"):
+        self.state = state if state is not None else ControllerState()
+        self.dataset_manager = DatasetManager()
+        self.transformer = TransformationEngine()
+        self.exporter = ExportManager()
+        self.persistence = persistence or PersistenceManager(db_path=db_path)
+        self.snapshot_dir = Path(snapshot_dir)
+        self._visualiser = None
+
+        # Re-sync manager with existing state (so MVC stays consistent)
+        if self.state.df is not None:
+            self.dataset_manager.set_active(
+                self.state.df,
+                name=self.state.dataset_name or "dataset",
+                source_type="Session",
+                source_reference=""
+            )
+
+    @property
+    def visualiser(self):
+        if self._visualiser is None:
+            from app.services.visualisation_engine import VisualisationEngine
+            self._visualiser = VisualisationEngine()
+        return self._visualiser
+
+    @property
+    def df(self) -> pd.DataFrame | None:
+        return self.state.df
+
+    @property
+    def last_figure(self):
+        return self.state.last_fig
+
+    def set_last_figure(self, fig):
+        self.state.last_fig = fig
+
+    def _set_df(self, df: pd.DataFrame, source_type: str, source_reference: str = "", name: str | None = None,
+                meta_name: str | None = None):
+        # Single place a new dataset version is installed; meta_name overrides the display name in metadata
+        self.state.df = df
+        self.state.crossfilter = None
+        if name is not None:
+            self.state.dataset_name = name
+        self.dataset_manager.set_active(df, name=meta_name or self.state.dataset_name or "dataset", source_type=source_type, source_reference=source_reference)
+        self._invalidate_caches()
+
+    def _invalidate_caches(self):
+        # No caches outside Streamlit; AppController overrides this
+        pass
+
+    # -------- Import ----------
+    def load_csv(self, source, dataset_name: str = "dataset"):
+        # source: path or file-like object (e.g. a Streamlit upload)
+        df = pd.read_csv(source)
+        self._set_df(df, source_type="CSV", source_reference=dataset_name, name=dataset_name)
+
+    def load_sample_iris(self):
+        # simple sample dataset (no sklearn dependency)
+        data = {
+            "sepal_length":[5.1,4.9,4.7,4.6,5.0,5.4,4.6,5.0],
+            "sepal_width":[3.5,3.0,3.2,3.1,3.6,3.9,3.4,3.4],
+            "petal_length":[1.4,1.4,1.3,1.5,1.4,1.7,1.4,1.5],
+            "petal_width":[0.2,0.2,0.2,0.2,0.2,0.4,0.3,0.2],
+            "species":["setosa","setosa","setosa","setosa","setosa","setosa","setosa","setosa"]
+        }
+        df = pd.DataFrame(data)
+        self._set_df(df, source_type="Sample", source_reference="Built-in", name="iris_sample.csv", meta_name="Iris Sample")
+
+    # -------- Profile ----------
+    def preview(self):
+        df = self.df
+        return df.head(30) if df is not None else pd.DataFrame()
+
+    def row_count(self): return int(self.df.shape[0]) if self.df is not None else 0
+    def column_count(self): return int(self.df.shape[1]) if self.df is not None else 0
+    def total_missing(self):
+        return int(self.df.isna().sum().sum()) if self.df is not None else 0
+
+    def column_types_df(self):
+        df = self.df
+        if df is None: return pd.DataFrame()
+        return pd.DataFrame({"column": df.columns, "dtype": [str(df[c].dtype) for c in df.columns]})
+
+    def missing_by_column_df(self):
+        df = self.df
+        if df is None: return pd.DataFrame()
+        miss = df.isna().sum().sort_values(ascending=False)
+        return pd.DataFrame({"column": miss.index, "missing_count": miss.values})
+
+    def describe_numeric(self):
+        df = self.df
+        if df is None: return pd.DataFrame()
+        num = df.select_dtypes(include="number")
+        return num.describe().T if not num.empty else pd.DataFrame()
+
+    def column_types(self):
+        if self.df is None: return {}
+        return {c: str(self.df[c].dtype) for c in self.df.columns}
+
+    def get_active_metadata(self):
+        return self.dataset_manager.get_meta()
+
+    # -------- Transform ----------
+    def apply_missing_strategy(self, strategy: str, custom_val: str | None):
+        self._set_df(self.transformer.handle_missing(self.df, strategy, custom_val), source_type="Transformed")
+
+    def apply_filter(self, column: str, op: str, value):
+        self._set_df(self.transformer.filter_rows(self.df, column, op, value), source_type="Transformed")
+
+    def apply_sort(self, columns: list[str], ascending: bool):
+        self._set_df(self.transformer.sort(self.df, columns, ascending), source_type="Transformed")
+
+    def apply_groupby(self, group_cols: list[str], agg_col: str | None, agg_fn: str):
+        self._set_df(self.transformer.group_aggregate(self.df, group_cols, agg_col, agg_fn), source_type="Transformed")
+
+    # -------- Visualise ----------
+    def make_xy_chart(self, chart_type: str, x: str, y: str, color: str | None = None):
+        return self.visualiser.xy_chart(chart_type, self.df, x, y, color)
+
+    def make_histogram(self, column: str, bins: int):
+        return self.visualiser.histogram(self.df, column, bins)
+
+    def make_correlation(self, columns: list[str]):
+        return self.visualiser.correlation_heatmap(self.df, columns)
+
+    def crossfilter_index(self, columns: list[str], bins: int = 50, measure: str | None = None, agg: str = "count") -> CrossFilterIndex:
+        # One index per dataset version and bin count; later brushes reuse it
+        xf = self.state.crossfilter
+        if xf is None or xf.df is not self.df or xf.bins != bins:
+            xf = CrossFilterIndex(self.df, bins=bins)
+            self.state.crossfilter = xf
+        xf.prepare(columns, measure, agg)
+        return xf
+
+    def make_linked_charts(self, columns: list[str], selections: dict[str, list[int]], bins: int = 50,
+                           measure: str | None = None, agg: str = "count"):
+        # selections: column -> selected bar (bin) numbers; returns ({column: figure}, rows in selection)
+        xf = self.crossfilter_index(columns, bins, measure, agg)
+        aggregates = xf.aggregate(columns, selections, measure, agg)
+        label = agg if agg == "count" else f"{agg}({measure})"
+        figs = {c: self.visualiser.linked_chart(a, label) for c, a in aggregates.items()}
+        return figs, xf.selected_count(selections)
+
+    # -------- Export ----------
+    def export_csv_bytes(self) -> bytes:
+        return self.exporter.csv_bytes(self.df)
+
+    def export_last_chart_png_bytes(self) -> bytes:
+        if self.last_figure is None:
+            raise ValueError("No chart available.")
+        return self.exporter.fig_png_bytes(self.last_figure)
+
+    # -------- Snapshots ----------
+    def save_snapshot(self, name: str) -> int:
+        df = self.df
+        if df is None:
+            raise ValueError("No dataset loaded.")
+        safe = "".join([c for c in name if c.isalnum() or c in ("-","_")]).strip() or "snapshot"
+        # Unique file per snapshot, so saving the same name again never rewrites an older snapshot's data
+        path = self.snapshot_dir / f"{safe}_{datetime.utcnow():%Y%m%dT%H%M%S}_{uuid.uuid4().hex[:8]}.parquet"
+        return self.persistence.save_snapshot(
+            name=safe,
+            df=df,
+            snapshot_path=path,
+            source_type="Snapshot",
+            source_reference=self.state.dataset_name or ""
+        )
+
+    def list_snapshots(self):
+        return self.persistence.list_snapshots()
+
+    def snapshot_page(self, limit: int = 50, cursor: tuple[str, int] | None = None, query: str = "", source_type: str | None = None):
+        return self.persistence.catalog_page(limit=limit, cursor=cursor, query=query, source_type=source_type)
+
+    def snapshots_with_column(self, column_name: str):
+        return self.persistence.snapshots_with_column(column_name)
+
+    def snapshot_source_types(self):
+        return self.persistence.source_types()
+
+    def load_snapshot(self, dataset_id: int):
+        df = self.persistence.load_snapshot_df(int(dataset_id))
+        self._set_df(df, source_type="Snapshot", name=f"snapshot_{dataset_id}")
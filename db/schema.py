@@ -8,10 +8,10 @@ class Base(DeclarativeBase):
 class Dataset(Base):
     __tablename__ = "datasets"
     dataset_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    name: Mapped[str] = mapped_column(String(255))
-    source_type: Mapped[str] = mapped_column(String(50))
+    name: Mapped[str] = mapped_column(String(255), index=True)
+    source_type: Mapped[str] = mapped_column(String(50), index=True)
     source_reference: Mapped[str] = mapped_column(String(500), default="")
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
     row_count: Mapped[int] = mapped_column(Integer)
     column_count: Mapped[int] = mapped_column(Integer)
     snapshot_path: Mapped[str] = mapped_column(String(800), default="")
@@ -23,7 +23,7 @@ class ColumnProfile(Base):
     __tablename__ = "column_profiles"
     profile_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     dataset_id: Mapped[int] = mapped_column(ForeignKey("datasets.dataset_id"), index=True)
-    column_name: Mapped[str] = mapped_column(String(255))
+    column_name: Mapped[str] = mapped_column(String(255), index=True)
     dtype: Mapped[str] = mapped_column(String(80))
     missing_count: Mapped[int] = mapped_column(Integer)
     unique_count: Mapped[int] = mapped_column(Integer)
@@ -40,3 +40,28 @@ class TransformationLog(Base):
     timestamp: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
     dataset: Mapped["Dataset"] = relationship(back_populates="logs")
+
+# Full-text catalog over snapshot and column names. External-content FTS5 tables
+# mirror the ORM tables through triggers, so ORM inserts/deletes stay in sync.
+CATALOG_FTS_DDL = {
+    "datasets_fts": [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS datasets_fts USING fts5(name, content='datasets', content_rowid='dataset_id')",
+        "CREATE TRIGGER IF NOT EXISTS datasets_fts_ai AFTER INSERT ON datasets BEGIN "
+        "INSERT INTO datasets_fts(rowid, name) VALUES (new.dataset_id, new.name); END",
+        "CREATE TRIGGER IF NOT EXISTS datasets_fts_ad AFTER DELETE ON datasets BEGIN "
+        "INSERT INTO datasets_fts(datasets_fts, rowid, name) VALUES ('delete', old.dataset_id, old.name); END",
+        "CREATE TRIGGER IF NOT EXISTS datasets_fts_au AFTER UPDATE OF name ON datasets BEGIN "
+        "INSERT INTO datasets_fts(datasets_fts, rowid, name) VALUES ('delete', old.dataset_id, old.name); "
+        "INSERT INTO datasets_fts(rowid, name) VALUES (new.dataset_id, new.name); END",
+    ],
+    "column_profiles_fts": [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS column_profiles_fts USING fts5(column_name, content='column_profiles', content_rowid='profile_id')",
+        "CREATE TRIGGER IF NOT EXISTS column_profiles_fts_ai AFTER INSERT ON column_profiles BEGIN "
+        "INSERT INTO column_profiles_fts(rowid, column_name) VALUES (new.profile_id, new.column_name); END",
+        "CREATE TRIGGER IF NOT EXISTS column_profiles_fts_ad AFTER DELETE ON column_profiles BEGIN "
+        "INSERT INTO column_profiles_fts(column_profiles_fts, rowid, column_name) VALUES ('delete', old.profile_id, old.column_name); END",
+        "CREATE TRIGGER IF NOT EXISTS column_profiles_fts_au AFTER UPDATE OF column_name ON column_profiles BEGIN "
+        "INSERT INTO column_profiles_fts(column_profiles_fts, rowid, column_name) VALUES ('delete', old.profile_id, old.column_name); "
+        "INSERT INTO column_profiles_fts(rowid, column_name) VALUES (new.profile_id, new.column_name); END",
+    ],
+}
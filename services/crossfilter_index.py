@@ -0,0 +1,294 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+import numpy as np
+import pandas as pd
+
+_MAX_CATEGORIES = 1000
+
+@dataclass
+class ColumnIndex:
+    name: str
+    kind: str                 # "numeric" or "categorical"
+    labels: list              # numeric: bin edges (n_bins + 1); categorical: category values (n_bins)
+    codes: np.ndarray         # bin code per row; code n_bins marks missing values
+    order: np.ndarray         # row ids sorted by bin code
+    offsets: np.ndarray       # rows in bin b are order[offsets[b]:offsets[b + 1]]
+    values: np.ndarray | None = None  # float64 values, kept for numeric measures
+
+    @property
+    def n_bins(self) -> int:
+        return len(self.offsets) - 2
+
+    @property
+    def totals(self) -> np.ndarray:
+        return np.diff(self.offsets)[:self.n_bins]
+
+    def bins_for_range(self, lo: float, hi: float) -> np.ndarray:
+        # Bins holding values in [lo, hi], matching _build's floor binning (the top edge is in the last bin)
+        if self.kind != "numeric":
+            raise ValueError(f"Column '{self.name}' is not numeric.")
+        edges = np.asarray(self.labels)
+        first = max(int(np.searchsorted(edges, lo, side="right")) - 1, 0)
+        last = min(int(np.searchsorted(edges, hi, side="right")) - 1, self.n_bins - 1)
+        return np.arange(first, max(last, first - 1) + 1)
+
+    def bins_for_values(self, values: list) -> np.ndarray:
+        lookup = {v: i for i, v in enumerate(self.labels)}
+        return np.array(sorted({lookup[v] for v in values if v in lookup}), dtype=np.int64)
+
+@dataclass
+class LinkedAggregate:
+    column: str
+    kind: str
+    labels: list
+    total: np.ndarray         # per-bin aggregate over all rows
+    selected: np.ndarray      # per-bin aggregate over rows passing the other charts' brushes
+    brushed_bins: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.int64))
+
+class CrossFilterIndex:
+    """Binned per-column indexes for linked brushing, built once per dataset version.
+
+    Each indexed column stores a compact bin code per row plus the row ids sorted by bin,
+    so the rows in any set of bins are contiguous slices of the sorted ids.
+
+    Brushing is maintained incrementally: every row keeps a count of the brushes it fails,
+    and each chart keeps its per-bin stats over rows failing no brush but its own. Moving a
+    brush only touches the rows entering or leaving it, so the cost follows the size of the
+    change rather than the row count.
+    """
+
+    def __init__(self, df: pd.DataFrame, bins: int = 50):
+        if bins < 1:
+            raise ValueError("Bins must be at least 1.")
+        self.df = df
+        self.bins = bins
+        self.row_count = int(df.shape[0])
+        self._columns: dict[str, ColumnIndex] = {}
+        self._totals: dict[tuple, np.ndarray] = {}
+        # Current brushes as bin lookups, and the number of them each row fails
+        self._luts: dict[str, np.ndarray] = {}
+        self._fails = np.zeros(self.row_count, dtype=np.uint8)
+        self._passing = self.row_count
+        # Per-chart stats for the current (measure, agg), kept in step with the brushes
+        self._view: tuple = (None, "count")
+        self._selected: dict[str, np.ndarray] = {}
+
+    def column(self, name: str) -> ColumnIndex:
+        # Built lazily, then reused for every brush on this dataset version
+        if name not in self._columns:
+            if name not in self.df.columns:
+                raise ValueError(f"Invalid column: {name}")
+            self._columns[name] = self._build(name, self.df[name])
+        return self._columns[name]
+
+    def _build(self, name: str, series: pd.Series) -> ColumnIndex:
+        values = None
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            kind = "numeric"
+            values = series.to_numpy(dtype="float64", na_value=np.nan)
+            finite = np.isfinite(values)
+            if finite.any():
+                lo, hi = float(values[finite].min()), float(values[finite].max())
+            else:
+                lo, hi = 0.0, 0.0
+            n_bins = self.bins if hi > lo else 1
+            width = (hi - lo) / n_bins if hi > lo else 1.0
+            labels = [lo + i * width for i in range(n_bins)] + [hi if hi > lo else lo + 1.0]
+            raw = np.floor((np.where(finite, values, lo) - lo) / width)
+            codes = np.clip(raw, 0, n_bins - 1).astype(self._code_dtype(n_bins))
+            codes[~finite] = n_bins
+        else:
+            kind = "categorical"
+            raw, uniques = pd.factorize(series, sort=True)
+            n_bins = len(uniques)
+            if n_bins > _MAX_CATEGORIES:
+                raise ValueError(f"Column '{name}' has too many categories ({n_bins}) for cross-filtering.")
+            labels = [str(u) for u in uniques]
+            codes = np.where(raw < 0, n_bins, raw).astype(self._code_dtype(n_bins))
+
+        # Stable radix-style sort on small integer codes; int32 row ids halve index memory
+        order = np.argsort(codes, kind="stable")
+        if self.row_count < np.iinfo(np.int32).max:
+            order = order.astype(np.int32)
+        offsets = np.concatenate(([0], np.cumsum(np.bincount(codes, minlength=n_bins + 1))))
+        return ColumnIndex(name=name, kind=kind, labels=labels, codes=codes, order=order, offsets=offsets, values=values)
+
+    def _code_dtype(self, n_bins: int):
+        # One extra code for missing values
+        if n_bins < np.iinfo(np.uint8).max:
+            return np.uint8
+        if n_bins < np.iinfo(np.uint16).max:
+            return np.uint16
+        return np.int32
+
+    def prepare(self, columns: list[str], measure: str | None = None, agg: str = "count"):
+        """Precompute indexes, totals and each chart's stats so a first brush on any chart is cheap."""
+        self._track(columns, self._check_measure(measure, agg), agg)
+
+    # -------- Brushing ----------
+    def aggregate(self, columns: list[str], brushes: dict[str, np.ndarray], measure: str | None = None, agg: str = "count") -> dict[str, LinkedAggregate]:
+        """Per-bin aggregates for each column, filtered by every brush except the column's own.
+
+        ``brushes`` maps column -> selected bin numbers (see ColumnIndex.bins_for_range / bins_for_values).
+        """
+        measure = self._check_measure(measure, agg)
+        brushes = self._normalise(brushes)
+        self._sync(brushes)
+        self._track(columns, measure, agg)
+        out = {}
+        for col in columns:
+            idx = self.column(col)
+            out[col] = LinkedAggregate(
+                column=col, kind=idx.kind, labels=idx.labels,
+                total=self._finish(self._total_stats(idx, measure, agg), agg),
+                selected=self._finish(self._selected[col], agg),
+                brushed_bins=brushes.get(col, np.array([], dtype=np.int64))
+            )
+        return out
+
+    def selected_count(self, brushes: dict[str, np.ndarray]) -> int:
+        self._sync(self._normalise(brushes))
+        return self._passing
+
+    def _check_measure(self, measure: str | None, agg: str) -> str | None:
+        if agg not in ("count", "sum", "mean"):
+            raise ValueError("Invalid aggregation function.")
+        if agg == "count":
+            return None
+        if measure is None:
+            raise ValueError("Select a measure column.")
+        if self.column(measure).values is None:
+            raise ValueError("Measure column must be numeric.")
+        return measure
+
+    def _normalise(self, brushes: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+        # A brush with no bins selected means "no filter" on that column
+        out = {}
+        for c, b in brushes.items():
+            b = np.unique(np.asarray(b, dtype=np.int64))
+            b = b[(b >= 0) & (b < self.column(c).n_bins)]
+            if len(b):
+                out[c] = b
+        if len(out) > np.iinfo(self._fails.dtype).max:
+            raise ValueError("Too many brushed columns.")
+        return out
+
+    # -------- Incremental maintenance ----------
+    def _track(self, columns: list[str], measure: str | None, agg: str):
+        # Keep stats only for the charts on screen; a chart new to the view gets one full pass
+        if (measure, agg) != self._view:
+            self._view = (measure, agg)
+            self._selected = {}
+        self._selected = {c: s for c, s in self._selected.items() if c in columns}
+        for col in columns:
+            idx = self.column(col)
+            self._total_stats(idx, measure, agg)
+            if col not in self._selected:
+                self._selected[col] = self._full_stats(idx)
+
+    def _sync(self, brushes: dict[str, np.ndarray]):
+        for col in set(self._luts) | set(brushes):
+            idx = self.column(col)
+            lut = self._lookup(idx, brushes[col]) if col in brushes else None
+            old = self._luts.get(col)
+            if old is None and lut is None or old is not None and lut is not None and np.array_equal(old, lut):
+                continue
+            self._move(idx, old, lut)
+
+    def _move(self, idx: ColumnIndex, old: np.ndarray | None, new: np.ndarray | None):
+        # None means "not brushed": every bin, including missing values, passes
+        everything = np.ones(idx.n_bins + 1, dtype=bool)
+        old_lut = everything if old is None else old
+        new_lut = everything if new is None else new
+        leave = self._slices(idx, np.flatnonzero(old_lut & ~new_lut))
+        enter = self._slices(idx, np.flatnonzero(new_lut & ~old_lut))
+
+        # Fail counts excluding this brush: before the move for leaving rows, after it for entering ones
+        fails = self._fails
+        leave_fails = fails[leave]
+        fails[leave] += 1
+        fails[enter] -= 1
+        enter_fails = fails[enter]
+        self._passing += int(np.count_nonzero(enter_fails == 0)) - int(np.count_nonzero(leave_fails == 0))
+        if new is None:
+            self._luts.pop(idx.name, None)
+        else:
+            self._luts[idx.name] = new
+
+        # A row counts for another chart when every brush it fails is that chart's own
+        measure, agg = self._view
+        for col, stats in self._selected.items():
+            if col == idx.name:
+                continue
+            c = self.column(col)
+            n = c.n_bins + 1
+            gone = leave[leave_fails == self._own_fails(c, leave)]
+            came = enter[enter_fails == self._own_fails(c, enter)]
+            self._selected[col] = (stats - self._stats(c.codes[gone], n, gone, measure, agg)
+                                   + self._stats(c.codes[came], n, came, measure, agg))
+
+    def _own_fails(self, idx: ColumnIndex, rows: np.ndarray) -> np.ndarray | int:
+        lut = self._luts.get(idx.name)
+        return 0 if lut is None else (~lut[idx.codes[rows]]).astype(np.uint8)
+
+    def _full_stats(self, idx: ColumnIndex) -> np.ndarray:
+        measure, agg = self._view
+        total = self._total_stats(idx, measure, agg)
+        if not any(c != idx.name for c in self._luts):
+            return total.copy()
+        # Aggregate whichever is smaller: rows counted for this chart, or rows left out
+        counted = self._fails == self._own_fails(idx, slice(None))
+        n_counted = int(np.count_nonzero(counted))
+        if n_counted <= self.row_count - n_counted:
+            rows = np.flatnonzero(counted)
+            return self._stats(idx.codes[rows], idx.n_bins + 1, rows, measure, agg)
+        rows = np.flatnonzero(~counted)
+        return total - self._stats(idx.codes[rows], idx.n_bins + 1, rows, measure, agg)
+
+    # -------- Row selection ----------
+    def _slices(self, idx: ColumnIndex, bins: np.ndarray) -> np.ndarray:
+        # Contiguous bin runs map to contiguous slices of the sorted row ids
+        if not len(bins):
+            return idx.order[:0]
+        breaks = np.flatnonzero(np.diff(bins) != 1) + 1
+        runs = np.split(bins, breaks)
+        return np.concatenate([idx.order[idx.offsets[run[0]]:idx.offsets[run[-1] + 1]] for run in runs])
+
+    def _lookup(self, idx: ColumnIndex, bins: np.ndarray) -> np.ndarray:
+        lut = np.zeros(idx.n_bins + 1, dtype=bool)
+        lut[bins] = True
+        return lut
+
+    # -------- Aggregates ----------
+    def _total_stats(self, idx: ColumnIndex, measure: str | None, agg: str) -> np.ndarray:
+        key = (idx.name, measure, agg)
+        if key not in self._totals:
+            self._totals[key] = self._stats(idx.codes, idx.n_bins + 1, None, measure, agg)
+        return self._totals[key]
+
+    def _stats(self, keys: np.ndarray, n: int, rows: np.ndarray | None, measure: str | None, agg: str) -> np.ndarray:
+        # Additive per-key statistics, so rows can be added to or taken out of a chart's stats.
+        # The last plane is always the row count: count -> [counts];
+        # sum -> [sums, counts]; mean -> [sums, non-missing counts, counts]
+        counts = np.bincount(keys, minlength=n).astype(np.float64)
+        if agg == "count":
+            return counts[np.newaxis]
+        vals = self.column(measure).values
+        vals = vals if rows is None else vals[rows]
+        finite = ~np.isnan(vals)
+        sums = np.bincount(keys, weights=np.where(finite, vals, 0.0), minlength=n)
+        if agg == "sum":
+            return np.stack([sums, counts])
+        return np.stack([sums, np.bincount(keys, weights=finite, minlength=n), counts])
+
+    def _finish(self, stats: np.ndarray, agg: str) -> np.ndarray:
+        # Drop the missing-value bin and turn additive stats into the requested aggregate;
+        # empty bins are reset to exactly zero so add/remove rounding never shows
+        stats = stats[:, :-1]
+        if agg == "count":
+            return stats[0].copy()
+        sums = np.where(stats[-1] > 0, stats[0], 0.0)
+        if agg == "sum":
+            return sums
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(stats[1] > 0, sums / np.maximum(stats[1], 1), np.nan)
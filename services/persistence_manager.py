@@ -1,12 +1,13 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
 import json
 import pandas as pd
-from sqlalchemy import create_engine, select
+from sqlalchemy import create_engine, select, text, inspect, and_, or_
 from sqlalchemy.orm import Session
 
-from app.db.schema import Base, Dataset, ColumnProfile, TransformationLog
+from app.db.schema import Base, Dataset, ColumnProfile, TransformationLog, CATALOG_FTS_DDL
 
 @dataclass
 class SnapshotInfo:
@@ -18,10 +19,43 @@ class SnapshotInfo:
     column_count: int
     snapshot_path: str
 
+@dataclass
+class SnapshotPage:
+    items: list[dict] = field(default_factory=list)
+    # (created_at isoformat, dataset_id) of the last row; pass back to fetch the next page
+    next_cursor: tuple[str, int] | None = None
+
+# Only the columns the catalog shows; avoids hydrating full ORM objects per row
+_CATALOG_COLUMNS = (
+    Dataset.dataset_id,
+    Dataset.name,
+    Dataset.source_type,
+    Dataset.created_at,
+    Dataset.row_count,
+    Dataset.column_count,
+    Dataset.snapshot_path,
+)
+
 class PersistenceManager:
     def __init__(self, db_path: str = "app.db"):
         self.engine = create_engine(f"sqlite:///{db_path}", future=True)
         Base.metadata.create_all(self.engine)
+        self._ensure_catalog()
+
+    def _ensure_catalog(self):
+        # create_all() skips indexes on tables that already exist, so add them to older app.db files too
+        with self.engine.begin() as conn:
+            for table in (Dataset.__table__, ColumnProfile.__table__):
+                for idx in table.indexes:
+                    idx.create(conn, checkfirst=True)
+
+            existing = set(inspect(conn).get_table_names())
+            for fts_table, statements in CATALOG_FTS_DDL.items():
+                for stmt in statements:
+                    conn.exec_driver_sql(stmt)
+                if fts_table not in existing:
+                    # Backfill rows saved before the FTS table existed
+                    conn.exec_driver_sql(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')")
 
     def save_snapshot(self, name: str, df: pd.DataFrame, snapshot_path: Path, source_type: str = "CSV", source_reference: str = "") -> int:
         # Save dataframe as parquet for efficient reload
@@ -58,19 +92,89 @@ class PersistenceManager:
 
     def list_snapshots(self) -> list[SnapshotInfo]:
         with Session(self.engine) as session:
-            rows = session.execute(select(Dataset).order_by(Dataset.created_at.desc())).scalars().all()
-            return [
-                SnapshotInfo(
-                    dataset_id=r.dataset_id,
-                    name=r.name,
-                    source_type=r.source_type,
-                    created_at=r.created_at.isoformat(timespec="seconds"),
-                    row_count=r.row_count,
-                    column_count=r.column_count,
-                    snapshot_path=r.snapshot_path
-                ).__dict__
-                for r in rows
-            ]
+            rows = session.execute(
+                select(*_CATALOG_COLUMNS).order_by(Dataset.created_at.desc(), Dataset.dataset_id.desc())
+            ).all()
+            return [self._info_for(r) for r in rows]
+
+    def catalog_page(self, limit: int = 50, cursor: tuple[str, int] | None = None,
+                     query: str = "", source_type: str | None = None) -> SnapshotPage:
+        # Keyset pagination: newest first, seeking past the cursor instead of using OFFSET
+        if limit < 1:
+            raise ValueError("Page size must be at least 1.")
+        stmt = select(*_CATALOG_COLUMNS)
+        if source_type:
+            stmt = stmt.where(Dataset.source_type == source_type)
+        terms = self._fts_terms(query)
+        if terms:
+            stmt = stmt.where(Dataset.dataset_id.in_(self._search_ids(terms)))
+        if cursor is not None:
+            created_at, dataset_id = datetime.fromisoformat(cursor[0]), int(cursor[1])
+            stmt = stmt.where(or_(
+                Dataset.created_at < created_at,
+                and_(Dataset.created_at == created_at, Dataset.dataset_id < dataset_id)
+            ))
+        stmt = stmt.order_by(Dataset.created_at.desc(), Dataset.dataset_id.desc()).limit(limit + 1)
+
+        with Session(self.engine) as session:
+            rows = session.execute(stmt).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            next_cursor = (last.created_at.isoformat(), last.dataset_id)
+        return SnapshotPage(items=[self._info_for(r) for r in rows], next_cursor=next_cursor)
+
+    def snapshots_with_column(self, column_name: str) -> list[SnapshotInfo]:
+        # Exact column-name lookup, answered from ColumnProfile without opening Parquet files
+        ids = select(ColumnProfile.dataset_id).where(ColumnProfile.column_name == column_name)
+        stmt = (
+            select(*_CATALOG_COLUMNS)
+            .where(Dataset.dataset_id.in_(ids))
+            .order_by(Dataset.created_at.desc(), Dataset.dataset_id.desc())
+        )
+        with Session(self.engine) as session:
+            return [self._info_for(r) for r in session.execute(stmt).all()]
+
+    def source_types(self) -> list[str]:
+        with Session(self.engine) as session:
+            return list(session.execute(select(Dataset.source_type).distinct().order_by(Dataset.source_type)).scalars())
+
+    def _search_ids(self, terms: list[str]):
+        # Each term may match the snapshot name or any of its column names; every term must match
+        per_term = [
+            "SELECT dataset_id FROM ("
+            f"SELECT rowid AS dataset_id FROM datasets_fts WHERE datasets_fts MATCH :t{i} "
+            "UNION "
+            "SELECT cp.dataset_id FROM column_profiles_fts "
+            "JOIN column_profiles cp ON cp.profile_id = column_profiles_fts.rowid "
+            f"WHERE column_profiles_fts MATCH :t{i})"
+            for i in range(len(terms))
+        ]
+        return text(" INTERSECT ".join(per_term)).bindparams(
+            **{f"t{i}": t for i, t in enumerate(terms)}
+        ).columns(dataset_id=Dataset.dataset_id.type)
+
+    def _fts_terms(self, query: str) -> list[str]:
+        # Quote each term so user input can't break FTS5 syntax; trailing * gives prefix matching.
+        # Terms without letters or digits produce no tokens and would match nothing, so they are dropped.
+        return [
+            '"' + t.replace('"', '""') + '"*'
+            for t in (query or "").split()
+            if any(ch.isalnum() for ch in t)
+        ]
+
+    def _info_for(self, row) -> dict:
+        return SnapshotInfo(
+            dataset_id=row.dataset_id,
+            name=row.name,
+            source_type=row.source_type,
+            created_at=row.created_at.isoformat(timespec="seconds"),
+            row_count=row.row_count,
+            column_count=row.column_count,
+            snapshot_path=row.snapshot_path
+        ).__dict__
 
     def load_snapshot_df(self, dataset_id: int) -> pd.DataFrame:
         with Session(self.engine) as session:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
 
 class VisualisationEngine:
     def xy_chart(self, chart_type: str, df: pd.DataFrame, x: str, y: str, color: str | None = None):
@@ -20,3 +21,25 @@ class VisualisationEngine:
             raise ValueError("Select at least one numeric column.")
         corr = df[columns].corr(numeric_only=True)
         return px.imshow(corr, text_auto=True, aspect="auto")
+
+    def linked_chart(self, agg, value_label: str = "count"):
+        # agg: LinkedAggregate from CrossFilterIndex; one bar per bin, so point_index == bin number
+        if agg.kind == "numeric":
+            edges = agg.labels
+            x = [(edges[i] + edges[i + 1]) / 2 for i in range(len(edges) - 1)]
+            width = [edges[i + 1] - edges[i] for i in range(len(edges) - 1)]
+        else:
+            x = agg.labels
+            width = None
+        brushed = set(int(b) for b in agg.brushed_bins)
+        colors = ["#1f77b4" if not brushed or i in brushed else "#aec7e8" for i in range(len(x))]
+
+        fig = go.Figure()
+        fig.add_bar(x=x, y=agg.total, width=width, name="All rows", marker_color="#d3d3d3")
+        fig.add_bar(x=x, y=agg.selected, width=width, name="Selection", marker_color=colors)
+        fig.update_layout(
+            title=agg.column, barmode="overlay", dragmode="select", selectdirection="h",
+            showlegend=False, margin=dict(l=10, r=10, t=40, b=10), height=300,
+            xaxis_title=agg.column, yaxis_title=value_label
+        )
+        return fig
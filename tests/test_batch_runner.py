@@ -0,0 +1,98 @@
+import os
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+from app.controller.batch_runner import BatchJob, BatchRunner
+from app.services.persistence_manager import PersistenceManager
+
+def _write_inputs(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    a = tmp_path / "a" / "sales.csv"
+    b = tmp_path / "b" / "stock.csv"
+    pd.DataFrame({"x": range(10), "g": ["p", "q"] * 5}).to_csv(a, index=False)
+    pd.DataFrame({"x": range(100, 120), "g": ["r"] * 20}).to_csv(b, index=False)
+    return a, b
+
+def test_run_filters_snapshots_and_exports(tmp_path):
+    a, b = _write_inputs(tmp_path)
+    runner = BatchRunner(db_path=str(tmp_path / "t.db"), snapshot_dir=tmp_path / "snaps", max_workers=2)
+    job = BatchJob(
+        steps=[{"op": "filter", "column": "x", "operator": ">=", "value": 5}],
+        snapshot=True,
+        export_dir=tmp_path / "out"
+    )
+    summary = runner.run([a, b], job)
+
+    assert summary.files_ok == 2 and summary.files_failed == 0
+    by_name = {os.path.basename(r.path): r for r in summary.results}
+    assert (by_name["sales.csv"].rows_in, by_name["sales.csv"].rows_out) == (10, 5)
+    assert (by_name["stock.csv"].rows_in, by_name["stock.csv"].rows_out) == (20, 20)
+    assert pd.read_csv(tmp_path / "out" / "sales.csv")["x"].min() == 5
+    assert len(pd.read_csv(tmp_path / "out" / "stock.csv")) == 20
+
+    persistence = PersistenceManager(db_path=str(tmp_path / "t.db"))
+    snaps = {s["name"]: s for s in persistence.list_snapshots()}
+    assert snaps["sales"]["row_count"] == 5 and snaps["stock"]["row_count"] == 20
+    assert persistence.load_snapshot_df(by_name["sales.csv"].snapshot_id)["x"].tolist() == [5, 6, 7, 8, 9]
+    assert summary.throughput()["rows_in"] == 30
+
+def test_same_stem_snapshots_keep_separate_files(tmp_path):
+    a, _ = _write_inputs(tmp_path)
+    runner = BatchRunner(db_path=str(tmp_path / "t.db"), snapshot_dir=tmp_path / "snaps", max_workers=2)
+    first = runner.run([a], BatchJob(snapshot=True)).results[0]
+    pd.DataFrame({"x": [42]}).to_csv(a, index=False)
+    second = runner.run([a], BatchJob(snapshot=True)).results[0]
+
+    persistence = PersistenceManager(db_path=str(tmp_path / "t.db"))
+    assert len(persistence.load_snapshot_df(first.snapshot_id)) == 10
+    assert persistence.load_snapshot_df(second.snapshot_id)["x"].tolist() == [42]
+
+def test_duplicate_export_stems_rejected(tmp_path):
+    a, _ = _write_inputs(tmp_path)
+    other = tmp_path / "b" / "sales.csv"
+    other.write_text("x\n1\n")
+    runner = BatchRunner(db_path=str(tmp_path / "t.db"), snapshot_dir=tmp_path / "snaps")
+    with pytest.raises(ValueError):
+        runner.run([a, other], BatchJob(export_dir=tmp_path / "out"))
+    assert not (tmp_path / "out").exists()
+
+def test_headless_run_does_not_import_streamlit_or_plotly(tmp_path):
+    # Fresh interpreter so imports made by other tests don't leak in
+    a, _ = _write_inputs(tmp_path)
+    code = (
+        "import sys\n"
+        "from app.controller.batch_runner import BatchJob, BatchRunner\n"
+        f"s = BatchRunner(db_path={str(tmp_path / 't.db')!r}, snapshot_dir={str(tmp_path / 'snaps')!r})"
+        f".run([{str(a)!r}], BatchJob(snapshot=True, export_dir={str(tmp_path / 'out')!r}))\n"
+        "print(s.files_ok, 'streamlit' in sys.modules, 'plotly' in sys.modules)\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+    assert out.stdout.split() == ["1", "False", "False"]
+
+@pytest.mark.parametrize("job", [
+    BatchJob(steps={"op": "filter"}),
+    BatchJob(steps=["filter"]),
+    BatchJob(steps=[{"op": "bogus"}]),
+    BatchJob(steps=[{"op": "filter", "column": "x"}]),
+    BatchJob(chart={"type": "Pie"}, export_dir="out"),
+    BatchJob(chart={"type": "Histogram"}, export_dir="out"),
+])
+def test_invalid_job_rejected_before_reading_files(tmp_path, job):
+    runner = BatchRunner(db_path=str(tmp_path / "t.db"), snapshot_dir=tmp_path / "snaps")
+    with pytest.raises(ValueError):
+        runner.run([tmp_path / "does_not_exist.csv"], job)
+
+def test_cli_rejects_bad_arguments(tmp_path, capsys):
+    from app.cli import main
+    a, _ = _write_inputs(tmp_path)
+    for argv in (["--workers", "0"], ["--steps", "missing_steps.json"], ["--steps", '{"op": "filter"}'],
+                 ["--steps", '[{"op": "bogus"}]']):
+        with pytest.raises(SystemExit) as exc:
+            main([str(a), "--db", str(tmp_path / "t.db"), *argv])
+        assert exc.value.code == 2
+    assert "--steps" in capsys.readouterr().err
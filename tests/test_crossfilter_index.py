@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.crossfilter_index import CrossFilterIndex
+
+COLUMNS = ["a", "b", "c", "d"]
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(7)
+    n = 3000
+    frame = pd.DataFrame({
+        "a": rng.normal(size=n),
+        "b": rng.exponential(size=n),
+        "c": rng.choice(["x", "y", "z", None], n),
+        "d": rng.uniform(0, 100, n),
+    })
+    frame.loc[::17, "a"] = np.nan
+    frame.loc[::13, "d"] = np.nan
+    return frame
+
+def _in_brush(xf, df, column, bins):
+    # Row mask for a brush, built from the raw frame rather than the index's codes
+    idx = xf.column(column)
+    if idx.kind == "categorical":
+        return df[column].astype(object).map(lambda v: v is not None and str(v) in {idx.labels[b] for b in bins}).to_numpy()
+    edges = idx.labels
+    lo, hi = edges[min(bins)], edges[max(bins) + 1]
+    values = df[column]
+    upper = values <= hi if max(bins) == idx.n_bins - 1 else values < hi
+    return ((values >= lo) & upper).to_numpy()
+
+def _expected(xf, df, column, brushes, measure, agg):
+    mask = np.ones(len(df), dtype=bool)
+    for c, bins in brushes.items():
+        if c != column and len(bins):
+            mask &= _in_brush(xf, df, c, bins)
+    idx = xf.column(column)
+    out = []
+    for b in range(idx.n_bins):
+        rows = mask & _in_brush(xf, df, column, [b])
+        if agg == "count":
+            out.append(float(rows.sum()))
+        else:
+            vals = df.loc[rows, measure].dropna()
+            out.append(vals.sum() if agg == "sum" else (vals.mean() if len(vals) else np.nan))
+    return np.array(out)
+
+def _random_brushes(xf, rng):
+    brushes = {}
+    for c in COLUMNS:
+        if rng.random() < 0.4:
+            continue
+        idx = xf.column(c)
+        if idx.kind == "categorical":
+            brushes[c] = sorted(rng.choice(idx.n_bins, rng.integers(1, idx.n_bins + 1), replace=False).tolist())
+        else:
+            lo = int(rng.integers(idx.n_bins))
+            brushes[c] = list(range(lo, int(rng.integers(lo, idx.n_bins)) + 1))
+    return brushes
+
+@pytest.mark.parametrize("agg, measure", [("count", None), ("sum", "d"), ("mean", "d"), ("mean", "a")])
+def test_aggregate_and_count_match_pandas(df, agg, measure):
+    xf = CrossFilterIndex(df, bins=12)
+    xf.prepare(COLUMNS, measure, agg)
+    rng = np.random.default_rng(1)
+    # A sequence of brushes moves, adds and clears selections, so rows enter and leave incrementally
+    for _ in range(25):
+        brushes = _random_brushes(xf, rng)
+        result = xf.aggregate(COLUMNS, brushes, measure=measure, agg=agg)
+        for c in COLUMNS:
+            np.testing.assert_allclose(result[c].selected, _expected(xf, df, c, brushes, measure, agg), equal_nan=True)
+        everything = np.ones(len(df), dtype=bool)
+        for c, bins in brushes.items():
+            everything &= _in_brush(xf, df, c, bins)
+        assert xf.selected_count(brushes) == int(everything.sum())
+
+def test_view_changes_keep_brushes(df):
+    xf = CrossFilterIndex(df, bins=12)
+    rng = np.random.default_rng(2)
+    brushes = _random_brushes(xf, rng)
+    xf.aggregate(COLUMNS[:2], brushes)
+    # Charts joining the view, and a new aggregation, start from the brushes already applied
+    for agg, measure in [("sum", "d"), ("count", None), ("mean", "a")]:
+        result = xf.aggregate(COLUMNS, brushes, measure=measure, agg=agg)
+        for c in COLUMNS:
+            np.testing.assert_allclose(result[c].selected, _expected(xf, df, c, brushes, measure, agg), equal_nan=True)
+
+def test_unbrushed_totals_exclude_missing(df):
+    xf = CrossFilterIndex(df, bins=10)
+    result = xf.aggregate(COLUMNS, {})
+    assert result["a"].total.sum() == df["a"].notna().sum()
+    assert result["c"].labels == ["x", "y", "z"]
+    assert result["c"].total.sum() == df["c"].notna().sum()
+    assert xf.selected_count({}) == len(df)
+
+def test_bins_for_range_matches_binning():
+    xf = CrossFilterIndex(pd.DataFrame({"v": [0.0, 1.0, 2.0, 3.0]}), bins=3)
+    idx = xf.column("v")
+    assert idx.labels == [0.0, 1.0, 2.0, 3.0]
+    assert idx.bins_for_range(1.0, 1.0).tolist() == [1]
+    assert idx.bins_for_range(0.5, 2.0).tolist() == [0, 1, 2]
+    assert idx.bins_for_range(-5, 10).tolist() == [0, 1, 2]
+    assert idx.bins_for_range(2.5, 1.0).tolist() == []
+    # Brushes snap outwards to whole bins; the max value lives in the last bin
+    assert xf.selected_count({"v": idx.bins_for_range(1.0, 1.0)}) == 1
+    assert xf.selected_count({"v": idx.bins_for_range(2.0, 3.0)}) == 2
+
+def test_invalid_measure_rejected(df):
+    xf = CrossFilterIndex(df, bins=10)
+    with pytest.raises(ValueError):
+        xf.aggregate(COLUMNS, {}, measure="c", agg="mean")
+    with pytest.raises(ValueError):
+        xf.aggregate(COLUMNS, {}, agg="median")
@@ -0,0 +1,107 @@
+import sqlite3
+from datetime import datetime
+
+import pandas as pd
+import pytest
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.db.schema import Dataset
+from app.services.persistence_manager import PersistenceManager
+
+@pytest.fixture
+def pm(tmp_path):
+    return PersistenceManager(db_path=str(tmp_path / "catalog.db"))
+
+def _save(pm, tmp_path, name, columns, source_type="Snapshot"):
+    df = pd.DataFrame({c: [1, 2] for c in columns})
+    return pm.save_snapshot(name, df, tmp_path / f"{name}.parquet", source_type=source_type)
+
+def _names(page):
+    return [s["name"] for s in page.items]
+
+def test_keyset_pages_break_created_at_ties_by_id(pm, tmp_path):
+    ids = [_save(pm, tmp_path, f"snap_{i}", ["x"]) for i in range(7)]
+    # Four snapshots share a timestamp; order within it must follow dataset_id
+    with Session(pm.engine) as session:
+        session.execute(update(Dataset).where(Dataset.dataset_id.in_(ids[1:5])).values(created_at=datetime(2030, 1, 1)))
+        session.commit()
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        page = pm.catalog_page(limit=3, cursor=cursor)
+        seen.extend(s["dataset_id"] for s in page.items)
+        pages += 1
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+    assert pages == 3
+    assert seen == [ids[4], ids[3], ids[2], ids[1], ids[6], ids[5], ids[0]]
+
+def test_last_page_has_no_cursor(pm, tmp_path):
+    for i in range(3):
+        _save(pm, tmp_path, f"snap_{i}", ["x"])
+    assert pm.catalog_page(limit=3).next_cursor is None
+    assert pm.catalog_page(limit=2).next_cursor is not None
+
+def test_source_type_filter(pm, tmp_path):
+    _save(pm, tmp_path, "from_csv", ["x"], source_type="CSV")
+    _save(pm, tmp_path, "saved", ["x"], source_type="Snapshot")
+    assert _names(pm.catalog_page(source_type="CSV")) == ["from_csv"]
+    assert pm.source_types() == ["CSV", "Snapshot"]
+
+def test_search_prefix_and_mixed_name_column_terms(pm, tmp_path):
+    _save(pm, tmp_path, "sales_q1", ["revenue", "region"])
+    _save(pm, tmp_path, "stock", ["sku", "revenue_est"])
+    _save(pm, tmp_path, "snap_3", ["col_3"])
+    assert _names(pm.catalog_page(query="reven")) == ["stock", "sales_q1"]
+    assert _names(pm.catalog_page(query="sales revenue")) == ["sales_q1"]
+    assert _names(pm.catalog_page(query="col_3 snap")) == ["snap_3"]
+    assert _names(pm.catalog_page(query="sales sku")) == []
+
+@pytest.mark.parametrize("query, expected", [
+    ('"', ["sales_q1"]),            # punctuation-only terms produce no tokens and don't filter
+    ("*", ["sales_q1"]),
+    ("-", ["sales_q1"]),
+    ("region*", ["sales_q1"]),
+    ("-region", ["sales_q1"]),
+    ('reg"ion', []),                # quoted as one phrase "reg ion"
+    ("NEAR", []),                   # plain term, not the NEAR operator
+    ("NEAR(region", []),
+    ("AND OR NOT", []),
+])
+def test_search_quotes_fts_syntax(pm, tmp_path, query, expected):
+    _save(pm, tmp_path, "sales_q1", ["revenue", "region"])
+    assert _names(pm.catalog_page(query=query)) == expected
+
+def test_snapshots_with_column(pm, tmp_path):
+    _save(pm, tmp_path, "a", ["revenue", "region"])
+    _save(pm, tmp_path, "b", ["revenue_est"])
+    assert [s["name"] for s in pm.snapshots_with_column("revenue")] == ["a"]
+    assert pm.snapshots_with_column("missing") == []
+
+def test_existing_old_schema_db_gets_indexes_and_search(tmp_path):
+    db = tmp_path / "old.db"
+    con = sqlite3.connect(db)
+    con.executescript("""
+        CREATE TABLE datasets (dataset_id INTEGER PRIMARY KEY, name VARCHAR(255), source_type VARCHAR(50),
+            source_reference VARCHAR(500), created_at DATETIME, row_count INTEGER, column_count INTEGER,
+            snapshot_path VARCHAR(800));
+        CREATE TABLE column_profiles (profile_id INTEGER PRIMARY KEY, dataset_id INTEGER REFERENCES datasets(dataset_id),
+            column_name VARCHAR(255), dtype VARCHAR(80), missing_count INTEGER, unique_count INTEGER, summary_json TEXT);
+        INSERT INTO datasets VALUES (1, 'legacy_sales', 'CSV', '', '2020-01-01 00:00:00.000000', 2, 1, '');
+        INSERT INTO column_profiles VALUES (1, 1, 'turnover', 'int64', 0, 2, '{}');
+    """)
+    con.commit()
+    con.close()
+
+    pm = PersistenceManager(db_path=str(db))
+    indexes = {r[0] for r in sqlite3.connect(db).execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"ix_datasets_created_at", "ix_datasets_name", "ix_datasets_source_type", "ix_column_profiles_column_name"} <= indexes
+    assert _names(pm.catalog_page(query="legacy")) == ["legacy_sales"]
+    assert _names(pm.catalog_page(query="turn")) == ["legacy_sales"]
+    assert [s["name"] for s in pm.snapshots_with_column("turnover")] == ["legacy_sales"]
+
+    # Rows added after the upgrade are indexed by the triggers
+    _save(pm, tmp_path, "fresh", ["turnover"])
+    assert _names(pm.catalog_page(query="turnover")) == ["fresh", "legacy_sales"]
@@ -11,3 +11,10 @@ def numeric_columns(df: pd.DataFrame):
 
 def all_columns(df: pd.DataFrame):
     return list(df.columns)
+
+def selected_point_indices(event) -> list[int]:
+    # Point indices from a st.plotly_chart selection event (box or click), across all traces
+    if not event:
+        return []
+    points = event.get("selection", {}).get("points", [])
+    return sorted({int(p["point_index"]) for p in points if "point_index" in p})